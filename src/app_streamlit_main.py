@@ -3,8 +3,12 @@ MenoBalance AI - Main Streamlit Application
 Comprehensive menopause prediction and wellness management platform.
 """
 
+import copy
+import importlib
 import os
-import sys
+import re
+import threading
+import time
 import warnings
 from datetime import datetime
 
@@ -14,8 +18,16 @@ import streamlit as st
 warnings.filterwarnings("ignore", message="The keyword arguments have been deprecated")
 warnings.filterwarnings("ignore", category=DeprecationWarning, module="plotly")
 
-# Add src directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Streamlit already puts this directory on sys.path for every script run
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _minify_css(css):
+    """Strip comments and redundant whitespace from a CSS string."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};:,>])\s*", r"\1", css).strip()
+
 
 # Page configuration
 st.set_page_config(
@@ -30,529 +42,365 @@ st.set_page_config(
     },
 )
 
-# Force sidebar to be always visible and non-collapsible
-st.markdown(
-    """
-    <style>
-        [data-testid="collapsedControl"] {display: none;}  /* hide the two arrows */
-        section[data-testid="stSidebar"] {
-            min-width: 320px !important;
-            max-width: 320px !important;
-        }
-        /* Hide Streamlit's default page navigation menu */
-        div[data-testid="stSidebarNav"] {display: none;}
-        div[data-testid="stSidebarNav"] + div {
-            padding-top: 1rem !important;
-        }
-    </style>
-""",
-    unsafe_allow_html=True,
-)
+# Web fonts used by the custom CSS
+_FONT_LINKS_HTML = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Poppins:wght@600;700&family=Inter:wght@400;500;600&display=swap">
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _load_custom_style_html():
+    """Read and minify static/menobalance.css once per server process."""
+    with open(os.path.join(_SRC_DIR, "static", "menobalance.css"), encoding="utf-8") as f:
+        css = f.read()
+    return _FONT_LINKS_HTML + f"<style>{_minify_css(css)}</style>"
 
 
 # Custom CSS for beautiful, empathetic design
 def load_custom_css():
-    """Load custom CSS for styling."""
-    st.markdown(
-        """
-    <style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700&family=Inter:wght@300;400;500;600&display=swap');
-    
-    /* Global Styles */
-    .main .block-container {
-        padding-top: 2rem;
-        padding-bottom: 2rem;
-        max-width: 1200px;
-    }
-    
-    
-    /* Header Styles */
-    .main-header {
-        background: linear-gradient(135deg, #9B59B6 0%, #E8DAEF 50%, #5DADE2 100%);
-        padding: 2rem;
-        border-radius: 15px;
-        margin-bottom: 2rem;
-        text-align: center;
-        box-shadow: 0 8px 32px rgba(155, 89, 182, 0.3);
-    }
-    
-    .main-header h1 {
-        color: white;
-        font-family: 'Poppins', sans-serif;
-        font-weight: 700;
-        font-size: 3rem;
-        margin-bottom: 0.5rem;
-        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-    }
-    
-    .main-header p {
-        color: white;
-        font-family: 'Inter', sans-serif;
-        font-size: 1.2rem;
-        opacity: 0.9;
-        margin: 0;
-    }
-    
-    /* Sidebar Styles */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #E8DAEF 0%, #F8F4FF 100%);
-    }
-    
-    .sidebar .sidebar-content {
-        background: linear-gradient(180deg, #E8DAEF 0%, #F8F4FF 100%);
-        display: block !important;
-        visibility: visible !important;
-        width: 300px !important;
-        min-width: 300px !important;
-    }
-    
-    /* Navigation Styles */
-    .nav-item {
-        padding: 0.75rem 1rem;
-        margin: 0.25rem 0;
-        border-radius: 10px;
-        transition: all 0.3s ease;
-        cursor: pointer;
-        font-family: 'Inter', sans-serif;
-        font-weight: 500;
-    }
-    
-    .nav-item:hover {
-        background: rgba(155, 89, 182, 0.1);
-        transform: translateX(5px);
-    }
-    
-    .nav-item.active {
-        background: linear-gradient(90deg, #9B59B6, #E8DAEF);
-        color: white;
-        box-shadow: 0 4px 15px rgba(155, 89, 182, 0.3);
-    }
-    
-    /* Card Styles */
-    .card {
-        background: white;
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-        margin: 1rem 0;
-        border: 1px solid rgba(155, 89, 182, 0.1);
-        transition: transform 0.3s ease, box-shadow 0.3s ease;
-    }
-    
-    .card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 8px 30px rgba(155, 89, 182, 0.2);
-    }
-    
-    .card-title {
-        font-family: 'Poppins', sans-serif;
-        font-weight: 600;
-        color: #9B59B6;
-        margin-bottom: 1rem;
-        font-size: 1.3rem;
-        text-decoration: none !important;
-    }
-    
-    .card-title::after {
-        content: none !important;
-    }
-    
-    /* Button Styles */
-    .stButton > button {
-        background: linear-gradient(45deg, #9B59B6, #E8DAEF);
-        color: white;
-        border: none;
-        border-radius: 10px;
-        padding: 0.75rem 2rem;
-        font-family: 'Inter', sans-serif;
-        font-weight: 500;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(155, 89, 182, 0.3);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(155, 89, 182, 0.4);
-    }
-    
-    /* Form Styles */
-    .stSelectbox > div > div {
-        border-radius: 10px;
-    }
-    
-    .stNumberInput > div > div > input {
-        border-radius: 10px;
-    }
-    
-    .stTextInput > div > div > input {
-        border-radius: 10px;
-    }
-    
-    /* Metric Styles */
-    .metric-card {
-        background: linear-gradient(135deg, #F8F4FF 0%, #E8DAEF 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        text-align: center;
-        margin: 0.5rem;
-        border: 2px solid rgba(155, 89, 182, 0.2);
-    }
-    
-    .metric-value {
-        font-family: 'Poppins', sans-serif;
-        font-weight: 700;
-        font-size: 2rem;
-        color: #9B59B6;
-        margin-bottom: 0.5rem;
-    }
-    
-    .metric-label {
-        font-family: 'Inter', sans-serif;
-        color: #666;
-        font-size: 0.9rem;
-    }
-    
-    /* Progress Bar Styles */
-    .progress-container {
-        background: rgba(155, 89, 182, 0.1);
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Alert Styles */
-    .stAlert {
-        border-radius: 10px;
-        border-left: 4px solid #9B59B6;
-    }
-    
-    /* Success Message */
-    .success-message {
-        background: linear-gradient(90deg, #E8F5E8, #F0F8F0);
-        border: 1px solid #4CAF50;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Info Message */
-    .info-message {
-        background: linear-gradient(90deg, #E3F2FD, #F0F8FF);
-        border: 1px solid #2196F3;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Warning Message */
-    .warning-message {
-        background: linear-gradient(90deg, #FFF8E1, #FFFBF0);
-        border: 1px solid #FF9800;
-        border-radius: 10px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .main-header h1 {
-            font-size: 2rem;
-        }
-        
-        .main-header p {
-            font-size: 1rem;
-        }
-        
-        .card {
-            padding: 1rem;
-        }
-    }
-    
-    /* Loading Animation */
-    .loading-spinner {
-        display: inline-block;
-        width: 20px;
-        height: 20px;
-        border: 3px solid rgba(155, 89, 182, 0.3);
-        border-radius: 50%;
-        border-top-color: #9B59B6;
-        animation: spin 1s ease-in-out infinite;
-    }
-    
-    @keyframes spin {
-        to { transform: rotate(360deg); }
-    }
-    
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header[data-testid="stHeader"] {visibility: hidden;}
-    </style>
-    """,
-        unsafe_allow_html=True,
-    )
+    """
+    Load custom CSS for styling.
+
+    This must run on every rerun: Streamlit removes any element a rerun does
+    not emit again, so a once-per-session guard would drop the styles after
+    the first interaction. The string itself is cached by _load_custom_style_html.
+    """
+    st.markdown(_load_custom_style_html(), unsafe_allow_html=True)
+
+
+# Session state keys and their initial values
+_SESSION_DEFAULTS = (
+    ("privacy_consent", False),
+    ("health_data", {}),
+    ("predictions", None),
+    ("chat_history", []),
+    ("wellness_scores", []),
+    ("current_page", "Home"),
+)
 
 
 def initialize_session_state():
-    """Initialize session state variables."""
-    if "privacy_consent" not in st.session_state:
-        st.session_state.privacy_consent = False
+    """Initialize session state variables once per session."""
+    session_state = st.session_state
+    if session_state.get("_initialized"):
+        return
+
+    for key, default in _SESSION_DEFAULTS:
+        # Copy so sessions never share the mutable defaults
+        session_state.setdefault(key, copy.copy(default))
+    session_state["_initialized"] = True
+
+    # Import the page modules while the user reads the landing page
+    _prewarm_pages()
+
 
-    if "health_data" not in st.session_state:
-        st.session_state.health_data = {}
+_CONSENT_INTRO_MD = (
+    "#### 🔒 Privacy & Data Protection\n\n"
+    "Your privacy is our top priority. Please review our data protection practices before continuing."
+)
 
-    if "predictions" not in st.session_state:
-        st.session_state.predictions = None
+_CONSENT_PROMISE_MD = """
+**Your Data Protection Promise:**
 
-    if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+- ✅ **Local Processing:** Your health data stays on your device
+- ✅ **No Data Sharing:** We never share your personal information
+- ✅ **AI Chat Only:** Nebius AI is used only for chatbot conversations
+- ✅ **Full Control:** You can delete your data anytime
+- ✅ **Educational Purpose:** Predictions are for guidance only
+"""
 
-    if "wellness_scores" not in st.session_state:
-        st.session_state.wellness_scores = []
 
-    if "current_page" not in st.session_state:
-        st.session_state.current_page = "Home"
+def _give_consent():
+    """Record privacy consent from a button callback, before the click's rerun renders."""
+    st.session_state.privacy_consent = True
 
 
 def show_privacy_consent():
     """Show privacy consent modal."""
-    if not st.session_state.privacy_consent:
-        st.markdown(
-            """
-            <div style="
-                background-color: #ffdddd;
-                border: 2px solid red;
-                border-radius: 12px;
-                padding: 15px;
-                margin-top: 20px;
-                margin-bottom: 20px;
-            ">
-                <h4 style="color: #b30000; margin-bottom: 8px;">🔒 Privacy & Data Protection</h4>
-                <p style="color: #333; font-size: 15px; margin: 0;">
-                    Your privacy is our top priority. Please review our data protection practices before continuing.
-                </p>
-            </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    st.error(_CONSENT_INTRO_MD)
+    st.markdown(_CONSENT_PROMISE_MD)
 
-        st.markdown("**Your Data Protection Promise:**")
-        st.markdown("""
-        - ✅ **Local Processing:** Your health data stays on your device
-        - ✅ **No Data Sharing:** We never share your personal information  
-        - ✅ **AI Chat Only:** Nebius AI is used only for chatbot conversations
-        - ✅ **Full Control:** You can delete your data anytime
-        - ✅ **Educational Purpose:** Predictions are for guidance only
-        """)
+    col1, col2 = st.columns(2)
+    with col1:
+        st.button("✅ I Accept & Continue", width="stretch", on_click=_give_consent)
+
+    with col2:
+        if st.button("❌ Decline", width="stretch"):
+            st.error("Privacy consent is required to use MenoBalance AI.")
+            st.stop()
+
+
+# Navigation menu as (label, page id) pairs
+_PAGES = (
+    ("🏠 Home", "Home"),
+    ("📝 Health Input", "Health Input"),
+    ("🔮 Predictions", "Predictions"),
+    ("📊 Wellness Dashboard", "Wellness Dashboard"),
+    ("⌚ Wearables", "Wearables"),
+    ("📈 Symptom Timeline", "Symptom Timeline"),
+    ("💬 AI Chatbot", "AI Chatbot"),
+    ("📚 Education", "Education"),
+    ("📊 Model Evaluation", "Model Evaluation"),
+    ("🔍 Explainability", "Explainability"),
+    ("⚖️ Ethics & Bias", "Ethics & Bias"),
+    ("📄 Export Summary", "Export Summary"),
+)
+_PAGE_IDS = tuple(page_id for _, page_id in _PAGES)
+_PAGE_LABEL_BY_ID = {page_id: label for label, page_id in _PAGES}
+
+_SIDEBAR_CONTACT_MD = """
+### 👩‍💻 Developer Contact
+
+**Vedika Goyal**
+
+📧 [vedikagoyal1509@gmail.com](mailto:vedikagoyal1509@gmail.com)
+
+---
+"""
+
+# Consent status box and contact block, emitted together as one element
+_SIDEBAR_CONSENT_GIVEN_HTML = (
+    '<div class="success-message">✅ Privacy consent given</div>\n' + _SIDEBAR_CONTACT_MD
+)
+_SIDEBAR_CONSENT_REQUIRED_HTML = (
+    '<div class="warning-message">⚠️ Privacy consent required</div>\n' + _SIDEBAR_CONTACT_MD
+)
 
-        col1, col2 = st.columns(2)
-        with col1:
-            if st.button("✅ I Accept & Continue", width="stretch"):
-                st.session_state.privacy_consent = True
-                st.rerun()
 
-        with col2:
-            if st.button("❌ Decline", width="stretch"):
-                st.error("Privacy consent is required to use MenoBalance AI.")
-                st.stop()
+@st.cache_data(ttl=60, show_spinner=False)
+def _session_clock(minute_key):
+    """Format the sidebar session info; minute_key buckets the cache per minute."""
+    now = datetime.now()
+    return f"### Session Info\n**Date:** {now:%B %d, %Y}  \n**Time:** {now:%I:%M %p}"
+
+
+def _on_nav_change():
+    """Switch to the page picked in the sidebar radio."""
+    st.session_state.current_page = st.session_state._nav_choice
 
 
 def render_sidebar():
     """Render the navigation sidebar."""
     with st.sidebar:
-        st.markdown(
-            """
-        <div style="text-align: center; margin-bottom: 2rem;">
-            <h2 style="color: #9B59B6; font-family: 'Poppins', sans-serif; margin-bottom: 0;">
-                🌸 MenoBalance AI
-            </h2>
-            <p style="color: #666; font-family: 'Inter', sans-serif; margin: 0;">
-                Your compassionate health companion
-            </p>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-        # Navigation menu
-        pages = {
-            "🏠 Home": "Home",
-            "📝 Health Input": "Health Input",
-            "🔮 Predictions": "Predictions",
-            "📊 Wellness Dashboard": "Wellness Dashboard",
-            "⌚ Wearables": "Wearables",
-            "📈 Symptom Timeline": "Symptom Timeline",
-            "💬 AI Chatbot": "AI Chatbot",
-            "📚 Education": "Education",
-            "📊 Model Evaluation": "Model Evaluation",
-            "🔍 Explainability": "Explainability",
-            "⚖️ Ethics & Bias": "Ethics & Bias",
-            "📄 Export Summary": "Export Summary",
-        }
+        st.header("🌸 MenoBalance AI", anchor=False)
+        st.caption("Your compassionate health companion")
 
         st.markdown("### Navigation")
 
-        for page_name, page_id in pages.items():
-            if st.button(page_name, key=f"nav_{page_id}", width="stretch"):
-                st.session_state.current_page = page_id
-                st.rerun()
+        # Keep the radio in step with pages that change current_page themselves
+        current_page = st.session_state.current_page
+        st.session_state._nav_choice = (
+            current_page if current_page in _PAGE_LABEL_BY_ID else _PAGE_IDS[0]
+        )
+        st.radio(
+            "Navigation",
+            _PAGE_IDS,
+            format_func=_PAGE_LABEL_BY_ID.get,
+            key="_nav_choice",
+            on_change=_on_nav_change,
+            label_visibility="collapsed",
+        )
 
         st.markdown("---")
 
-        # Privacy status
-        if st.session_state.privacy_consent:
-            st.success("✅ Privacy consent given")
-        else:
-            st.warning("⚠️ Privacy consent required")
+        # Privacy status and developer contact
+        st.markdown(
+            _SIDEBAR_CONSENT_GIVEN_HTML
+            if st.session_state.privacy_consent
+            else _SIDEBAR_CONSENT_REQUIRED_HTML,
+            unsafe_allow_html=True,
+        )
 
-        # Developer contact
-        st.markdown("### 👩‍💻 Developer Contact")
-        st.markdown("**Vedika Goyal**")
-        st.markdown("📧 [vedikagoyal1509@gmail.com](mailto:vedikagoyal1509@gmail.com)")
+        # Session info
+        st.markdown(_session_clock(int(time.time() // 60)))
 
-        st.markdown("---")
 
-        # Session info
-        st.markdown("### Session Info")
-        st.markdown(f"**Date:** {datetime.now().strftime('%B %d, %Y')}")
-        st.markdown(f"**Time:** {datetime.now().strftime('%I:%M %p')}")
+_HEADER_HTML = """
+<div class="main-header">
+    <h1>🌸 MenoBalance AI</h1>
+    <p>Empowering women through AI-driven menopause prediction and wellness management</p>
+</div>
+"""
 
 
 def render_header():
     """Render the main header."""
-    st.markdown(
-        """
-    <div class="main-header">
-        <h1>🌸 MenoBalance AI</h1>
-        <p>Empowering women through AI-driven menopause prediction and wellness management</p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
-
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+
+
+_WELCOME_HTML = """
+<div class="card">
+    <h2 class="card-title" style="text-decoration: none; color: #9B59B6;">Welcome to Your Health Journey</h2>
+    <p style="font-family: 'Inter', sans-serif; font-size: 1.1rem; line-height: 1.6;">
+        MenoBalance AI is designed to provide compassionate support and evidence-based insights
+        during your menopause transition. Our AI-powered platform helps you understand your body's
+        changes and make informed decisions about your health and wellness.
+    </p>
+</div>
+"""
 
-def render_home_page():
-    """Render the home page."""
-    st.markdown(
-        """
+_FEATURE_CARD_TEMPLATE = """
     <div class="card">
-        <h2 class="card-title" style="text-decoration: none; color: #9B59B6;">Welcome to Your Health Journey</h2>
-        <p style="font-family: 'Inter', sans-serif; font-size: 1.1rem; line-height: 1.6;">
-            MenoBalance AI is designed to provide compassionate support and evidence-based insights 
-            during your menopause transition. Our AI-powered platform helps you understand your body's 
-            changes and make informed decisions about your health and wellness.
-        </p>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+        <h3 class="card-title">{title}</h3>
+        <p>{body}</p>
+    </div>"""
+_FEATURE_CARDS = (
+    (
+        "🔮 AI Predictions",
+        "Get personalized predictions about menopause stage, timeline, and symptom severity with confidence intervals.",
+    ),
+    (
+        "📊 Wellness Tracking",
+        "Monitor your daily wellness score and track progress with interactive visualizations and insights.",
+    ),
+    (
+        "💬 AI Support",
+        "Chat with our empathetic AI assistant for personalized recommendations and educational content.",
+    ),
+)
 
-    # Feature overview
-    col1, col2, col3 = st.columns(3)
+# Buttons under the feature cards as (label, widget key, target page id)
+_FEATURE_LINKS = (
+    ("Explore AI Predictions →", "ai_predictions_card", "Predictions"),
+    ("Explore Wellness Tracking →", "wellness_tracking_card", "Wellness Dashboard"),
+    ("Explore AI Support →", "ai_support_card", "AI Chatbot"),
+)
 
-    with col1:
-        if st.button(
-            "🔮 AI Predictions\n\nGet personalized predictions about menopause stage, timeline, and symptom severity with confidence intervals.\n\nClick to explore →",
-            key="ai_predictions_card",
-            help="Click to go to AI Predictions page",
-            width="stretch",
-        ):
-            st.session_state.current_page = "Predictions"
-            st.rerun()
+_QUICK_START_HTML = """
+<div class="card">
+    <h3 style="color: #9B59B6;">🚀 Quick Start Guide</h3>
+    <ol style="font-family: 'Inter', sans-serif; line-height: 1.8;">
+        <li><strong>Health Input:</strong> Complete your health information form</li>
+        <li><strong>Get Predictions:</strong> View your personalized menopause predictions</li>
+        <li><strong>Track Wellness:</strong> Monitor your daily wellness score</li>
+        <li><strong>Chat with AI:</strong> Get personalized support and recommendations</li>
+        <li><strong>Export Summary:</strong> Download your health summary report</li>
+    </ol>
+</div>
+"""
 
-    with col2:
-        if st.button(
-            "📊 Wellness Tracking\n\nMonitor your daily wellness score and track progress with interactive visualizations and insights.\n\nClick to explore →",
-            key="wellness_tracking_card",
-            help="Click to go to Wellness Dashboard page",
-            width="stretch",
-        ):
-            st.session_state.current_page = "Wellness Dashboard"
-            st.rerun()
-
-    with col3:
-        if st.button(
-            "💬 AI Support\n\nChat with our empathetic AI assistant for personalized recommendations and educational content.\n\nClick to explore →",
-            key="ai_support_card",
-            help="Click to go to AI Chatbot page",
-            width="stretch",
-        ):
-            st.session_state.current_page = "AI Chatbot"
-            st.rerun()
-
-    # Quick start guide
-    st.markdown(
-        """
-    <div class="card">
-        <h3 style="color: #9B59B6;">🚀 Quick Start Guide</h3>
-        <ol style="font-family: 'Inter', sans-serif; line-height: 1.8;">
-            <li><strong>Health Input:</strong> Complete your health information form</li>
-            <li><strong>Get Predictions:</strong> View your personalized menopause predictions</li>
-            <li><strong>Track Wellness:</strong> Monitor your daily wellness score</li>
-            <li><strong>Chat with AI:</strong> Get personalized support and recommendations</li>
-            <li><strong>Export Summary:</strong> Download your health summary report</li>
-        </ol>
-    </div>
-    """,
-        unsafe_allow_html=True,
+_PARTNER_TEMPLATE = "**{name}**\n\n{blurb}\n"
+_PARTNERS = (
+    (
+        "OpenLongevity",
+        "Thanks to **OpenLongevity** for Hackaging AI — providing the platform and resources that made this project possible.",
+    ),
+    (
+        "Nebius.ai",
+        "Powered by **Nebius.ai** for AI capabilities and intelligent chatbot functionality that enhances user experience.",
+    ),
+    (
+        "AthenaDAO",
+        "Grateful to **AthenaDAO** for guidance and support in developing ethical AI solutions for women's health.",
+    ),
+)
+_FOOTER_HTML = """
+<div style="text-align: center; margin-top: 2rem; padding: 1rem; background: linear-gradient(135deg, #F8F4FF 0%, #E8DAEF 100%); border-radius: 10px;">
+    <p style="color: #9B59B6; font-family: 'Inter', sans-serif; margin: 0.5rem 0;">
+        <strong>Developed by Vedika Goyal</strong>
+    </p>
+    <p style="color: #666; font-family: 'Inter', sans-serif; margin: 0.5rem 0;">
+        📧 <a href="mailto:vedikagoyal1509@gmail.com" style="color: #9B59B6; text-decoration: none;">vedikagoyal1509@gmail.com</a>
+    </p>
+    <p style="color: #999; font-family: 'Inter', sans-serif; font-size: 0.9rem; margin: 0;">
+        Empowering women through AI-driven menopause prediction and wellness management
+    </p>
+</div>
+"""
+
+
+# The script body re-executes on every rerun, so the joined segments are
+# built by a cached factory rather than as module-level expressions
+@st.cache_resource(show_spinner=False)
+def _home_static_markdown():
+    """Build the static home-page segments between widgets, fused into one element each."""
+    features = (
+        '\n<div class="feature-grid">'
+        + "".join(_FEATURE_CARD_TEMPLATE.format(title=title, body=body) for title, body in _FEATURE_CARDS)
+        + "\n</div>\n"
+    )
+    acknowledgements = "### 🤝 Acknowledgements\n\n" + "\n".join(
+        _PARTNER_TEMPLATE.format(name=name, blurb=blurb) for name, blurb in _PARTNERS
+    )
+    return (
+        _WELCOME_HTML + features,
+        _QUICK_START_HTML + "\n" + acknowledgements,
+        "---\n" + _FOOTER_HTML,
     )
 
-    # Credits and acknowledgments
-    with st.container():
-        st.markdown("### 🤝 Acknowledgements")
 
-        st.markdown("**OpenLongevity**")
-        st.write(
-            "Thanks to **OpenLongevity** for Hackaging AI — providing the platform and resources that made this project possible."
-        )
+def _navigate_to(page_id):
+    """Switch page from a button callback, before the click's rerun renders."""
+    st.session_state.current_page = page_id
 
-        st.markdown("**Nebius.ai**")
-        st.write(
-            "Powered by **Nebius.ai** for AI capabilities and intelligent chatbot functionality that enhances user experience."
-        )
 
-        st.markdown("**AthenaDAO**")
-        st.write(
-            "Grateful to **AthenaDAO** for guidance and support in developing ethical AI solutions for women's health."
-        )
+def render_home_page():
+    """Render the home page."""
+    intro_html, guide_md, footer_md = _home_static_markdown()
 
-    # Privacy notice
-    if not st.session_state.privacy_consent:
-        st.markdown(
-            """
-        <div class="warning-message">
-            <h4>🔒 Privacy Consent Required</h4>
-            <p>Please provide your privacy consent to access all features of MenoBalance AI.</p>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
+    # Welcome card and feature overview
+    st.markdown(intro_html, unsafe_allow_html=True)
 
-        col1, col2, col3 = st.columns([1, 2, 1])
-        with col2:
-            if st.button("Provide Privacy Consent", width="stretch"):
-                st.session_state.privacy_consent = True
-                st.rerun()
+    for column, (label, key, page_id) in zip(st.columns(3), _FEATURE_LINKS):
+        with column:
+            st.button(
+                label,
+                key=key,
+                help=f"Click to go to {page_id} page",
+                width="stretch",
+                on_click=_navigate_to,
+                args=(page_id,),
+            )
+
+    # Quick start guide, credits and acknowledgments
+    st.markdown(guide_md, unsafe_allow_html=True)
 
     # Footer with developer info
-    st.markdown("---")
-    st.markdown(
-        """
-        <div style="text-align: center; margin-top: 2rem; padding: 1rem; background: linear-gradient(135deg, #F8F4FF 0%, #E8DAEF 100%); border-radius: 10px;">
-            <p style="color: #9B59B6; font-family: 'Inter', sans-serif; margin: 0.5rem 0;">
-                <strong>Developed by Vedika Goyal</strong>
-            </p>
-            <p style="color: #666; font-family: 'Inter', sans-serif; margin: 0.5rem 0;">
-                📧 <a href="mailto:vedikagoyal1509@gmail.com" style="color: #9B59B6; text-decoration: none;">vedikagoyal1509@gmail.com</a>
-            </p>
-            <p style="color: #999; font-family: 'Inter', sans-serif; font-size: 0.9rem; margin: 0;">
-                Empowering women through AI-driven menopause prediction and wellness management
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(footer_md, unsafe_allow_html=True)
+
+
+# Page id -> (module path, render function name)
+_PAGE_RENDERERS = {
+    "Health Input": ("pages.health_input", "render_health_input_page"),
+    "Predictions": ("pages.predictions", "render_predictions_page"),
+    "Wellness Dashboard": ("pages.wellness_dashboard", "render_wellness_dashboard"),
+    "Wearables": ("pages.wearables", "render_wearables_page"),
+    "Symptom Timeline": ("pages.symptom_timeline", "render_symptom_timeline_page"),
+    "AI Chatbot": ("pages.chatbot", "render_chatbot_page"),
+    "Education": ("pages.education", "render_education_page"),
+    "Model Evaluation": ("pages.model_evaluation", "render_model_evaluation_page"),
+    "Explainability": ("pages.model_explainability", "render_explainability_page"),
+    "Ethics & Bias": ("pages.ethics_bias", "render_ethics_page"),
+    "Export Summary": ("pages.export", "render_export_page"),
+}
+
+
+# Not cached across reruns: Streamlit evicts edited page modules from
+# sys.modules, and after the first import this is only a dict lookup anyway
+def _get_page(page_id):
+    """Import a page module on first use and return its render function."""
+    module_path, func_name = _PAGE_RENDERERS[page_id]
+    return getattr(importlib.import_module(module_path), func_name)
+
+
+def _import_page_modules():
+    """Import every page module so the first navigation skips the cold import."""
+    for module_path, _ in _PAGE_RENDERERS.values():
+        try:
+            importlib.import_module(module_path)
+        except Exception:
+            # Leave it to _get_page to surface the error when the page is opened
+            pass
+
+
+@st.cache_resource(show_spinner=False)
+def _prewarm_pages():
+    """Start importing the page modules in the background, once per server process."""
+    thread = threading.Thread(target=_import_page_modules, name="page-prewarm", daemon=True)
+    thread.start()
+    return thread
 
 
 def main():
@@ -566,64 +414,21 @@ def main():
     # Render sidebar navigation
     render_sidebar()
 
-    # Show privacy consent if needed
-    show_privacy_consent()
-
-    # Render header
-    render_header()
+    # Show privacy consent if needed; no page renders until it is given
+    if not st.session_state.privacy_consent:
+        show_privacy_consent()
+        return
 
-    # Route to appropriate page
+    # Route to appropriate page; the main header is only shown on Home
     current_page = st.session_state.current_page
-
-    if current_page == "Home":
-        render_home_page()
-    elif current_page == "Health Input":
-        from pages.health_input import render_health_input_page
-
-        render_health_input_page()
-    elif current_page == "Predictions":
-        from pages.predictions import render_predictions_page
-
-        render_predictions_page()
-    elif current_page == "Wellness Dashboard":
-        from pages.wellness_dashboard import render_wellness_dashboard
-
-        render_wellness_dashboard()
-    elif current_page == "Wearables":
-        from pages.wearables import render_wearables_page
-
-        render_wearables_page()
-    elif current_page == "Symptom Timeline":
-        from pages.symptom_timeline import render_symptom_timeline_page
-
-        render_symptom_timeline_page()
-    elif current_page == "AI Chatbot":
-        from pages.chatbot import render_chatbot_page
-
-        render_chatbot_page()
-    elif current_page == "Education":
-        from pages.education import render_education_page
-
-        render_education_page()
-    elif current_page == "Model Evaluation":
-        from pages.model_evaluation import render_model_evaluation_page
-
-        render_model_evaluation_page()
-    elif current_page == "Explainability":
-        from pages.model_explainability import render_explainability_page
-
-        render_explainability_page()
-    elif current_page == "Ethics & Bias":
-        from pages.ethics_bias import render_ethics_page
-
-        render_ethics_page()
-    elif current_page == "Export Summary":
-        from pages.export import render_export_page
-
-        render_export_page()
+    if current_page in _PAGE_RENDERERS:
+        _get_page(current_page)()
     else:
+        render_header()
         render_home_page()
 
 
 if __name__ == "__main__":
-    main()
+    # Register main() as the app's only page so Streamlit does not also
+    # auto-discover the helper modules in src/pages/ as standalone pages
+    st.navigation([st.Page(main, title="MenoBalance AI", default=True)], position="hidden").run()
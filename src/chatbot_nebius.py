@@ -3,14 +3,38 @@ Nebius AI Integration Service for MenoBalance AI
 Provides chatbot, health recommendations, and educational content generation.
 """
 
+import asyncio
+import atexit
+import functools
+import hashlib
+import json
 import logging
 import os
 import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:
+    # orjson is an optional speedup; the standard library gives the same results
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
 
 # Load environment variables
 try:
@@ -22,67 +46,278 @@ except Exception as e:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Counseling system prompts for each kind of Nebius AI request
+_CHAT_SYSTEM_PROMPT = """You are a compassionate and knowledgeable menopause counselor and women's health specialist.
+
+The user may be experiencing menopause-related issues and needs empathetic support and guidance.
+
+Please respond as a caring counselor who:
+- Shows empathy and understanding
+- Provides evidence-based information about menopause
+- Offers practical coping strategies
+- Encourages professional medical consultation when appropriate
+- Uses a warm, supportive tone
+- Validates their experiences and concerns
+
+Remember to be sensitive to the personal nature of their questions and maintain a professional yet caring demeanor."""
+
+_REC_SYSTEM_PROMPT = """You are a compassionate menopause counselor and women's health specialist.
+
+Based on the user's health data and predictions, provide personalized, empathetic recommendations that:
+- Show understanding and validation of their experience
+- Offer practical, evidence-based coping strategies
+- Consider their specific menopause stage and symptoms
+- Encourage professional medical consultation when appropriate
+- Use a warm, supportive tone
+- Prioritize their wellbeing and quality of life
+
+Format your response as a list of recommendations with categories, titles, descriptions, and priority levels."""
+
+_EDU_SYSTEM_PROMPT = """You are a compassionate menopause counselor and women's health educator.
+
+Provide educational content about the requested topic that:
+- Uses clear, accessible language that's easy to understand
+- Shows empathy and understanding for women's experiences
+- Provides evidence-based information
+- Offers practical tips and strategies
+- Encourages professional medical consultation when appropriate
+- Uses a warm, supportive tone
+- Validates that menopause experiences are normal and manageable
+
+Structure your response with a clear title and comprehensive, empathetic content."""
+
+# Request settings shared by every chat completion
+_BASE_CHAT_BODY = MappingProxyType(
+    {
+        "model": "deepseek-ai/DeepSeek-R1-0528",  # Using the model from Nebius AI docs
+        "max_tokens": 500,
+        "temperature": 0.7,
+    }
+)
+
+# Longest user message sent to Nebius AI; completion latency grows with prompt length
+_MAX_USER_MESSAGE_CHARS = 4000
+
+# Upper bound on Nebius AI requests a batch call keeps in flight at once
+_MAX_CONCURRENT_REQUESTS = 8
+
+# Conversation contexts kept before the least recently used session is dropped,
+# and how long an untouched session survives
+_MAX_SESSIONS = 10_000
+_SESSION_IDLE_SECONDS = 3600
+
+# Successful Nebius AI responses kept for identical repeat requests
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _compile_keyword_groups(groups):
+    """Compile keyword groups into one pattern; each match names its group's index."""
+    alternatives = "|".join(
+        f"(?P<g{index}>{'|'.join(map(re.escape, words))})" for index, words in enumerate(groups)
+    )
+    # Zero-width lookahead so overlapping keywords are all seen in a single scan
+    return re.compile(f"(?=(?:{alternatives}))")
+
+
+def _match_keyword_group(pattern, text):
+    """Return the index of the first-listed keyword group found in text, or None."""
+    best = None
+    for match in pattern.finditer(text):
+        index = int(match.lastgroup[1:])
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return best
+
+
+@functools.lru_cache(maxsize=64)
+def _match_topic_keyword_group(pattern, topic):
+    """Cached _match_keyword_group for education topics.
+
+    The education page resends the same few fixed topics; user chat messages are
+    never cached, so their text is not kept in memory past the request.
+    """
+    return _match_keyword_group(pattern, topic)
+
+
+def _dumps_health_data(health_data):
+    """Serialize health data for a prompt, sorted when its keys are comparable."""
+    try:
+        return json.dumps(health_data, sort_keys=True, default=str)
+    except TypeError:
+        pass
+    try:
+        # Mixed key types such as {1: ..., "b": ...} cannot be sorted
+        return json.dumps(health_data, default=str)
+    except TypeError:
+        # Keys JSON cannot encode at all (tuples, dates, numpy ints); the repr always works
+        return repr(health_data)
+
+
+def _freeze(value):
+    """Recursively wrap nested dicts in read-only mappings."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+# Fallback content for when Nebius AI is unavailable, shared read-only by all instances
+_FALLBACK_CONTENT = _freeze(
+    {
+        "chat_responses": (
+            "I understand you're going through a challenging time. How can I help support you today?",
+            "It's completely normal to have questions about menopause. I'm here to listen and provide guidance.",
+            "Your health and wellbeing matter. What specific concerns would you like to discuss?",
+            "Every woman's experience is unique. Let's work together to find what helps you feel your best.",
+            "I'm here to provide compassionate support and evidence-based information. What's on your mind?",
+        ),
+        "recommendations": {
+            "pre_menopause": (
+                "Focus on maintaining regular menstrual cycles through balanced nutrition and stress management.",
+                "Consider tracking your cycles to understand your body's patterns better.",
+                "Regular exercise can help support hormonal balance and overall health.",
+            ),
+            "peri_menopause": (
+                "Monitor symptoms closely and consider keeping a symptom diary.",
+                "Cooling strategies like fans, light clothing, and cool drinks can help with hot flashes.",
+                "Stress management techniques such as meditation or yoga may help with mood changes.",
+            ),
+            "post_menopause": (
+                "Prioritize bone health with calcium-rich foods and weight-bearing exercise.",
+                "Focus on cardiovascular health through regular physical activity and heart-healthy diet.",
+                "Continue monitoring your overall health and discuss any concerns with your healthcare provider.",
+            ),
+        },
+        "educational_content": {
+            "menopause_stages": {
+                "title": "Understanding Menopause Stages",
+                "content": "Menopause is a natural biological process that occurs in three stages: Pre-menopause (regular cycles), Peri-menopause (transition with irregular cycles), and Post-menopause (12+ months without periods).",
+            },
+            "symptoms": {
+                "title": "Common Menopause Symptoms",
+                "content": "Common symptoms include hot flashes, night sweats, mood changes, sleep disturbances, vaginal dryness, and changes in menstrual cycles. Each woman's experience is unique.",
+            },
+            "lifestyle": {
+                "title": "Lifestyle Management",
+                "content": "Regular exercise, balanced nutrition, stress management, adequate sleep, and avoiding smoking can help manage menopause symptoms and support overall health.",
+            },
+        },
+    }
+)
+
 
 class NebiusAIService:
     """
     Service for integrating with Nebius AI for chatbot, recommendations, and educational content.
     """
 
+    __slots__ = (
+        "api_key",
+        "base_url",
+        "_completions_url",
+        "session_context",
+        "_session_touched",
+        "_session_lock",
+        "_response_cache",
+        "_response_cache_lock",
+        "_session",
+        "_stats",
+        "_stats_lock",
+        "fallback_responses",
+    )
+
+    # Fallback chat keywords in priority order, matched in one pass over the message
+    _CHAT_KEYWORDS = _compile_keyword_groups(
+        (
+            ("hot flash", "hot flush", "sweating"),
+            ("sleep", "insomnia", "tired"),
+            ("mood", "depression", "anxiety", "emotional"),
+            ("weight", "gain", "lose"),
+            ("exercise", "workout", "fitness"),
+            ("diet", "nutrition", "food", "eat"),
+        )
+    )
+    _CHAT_KEYWORD_RESPONSES = (
+        "I understand that hot flashes can be really challenging and disruptive to your daily life. You're not alone in this experience. Try wearing layers that you can easily remove, using a fan, drinking cool water, and avoiding triggers like spicy foods and stress. If they're severely impacting your quality of life, I'd encourage you to discuss treatment options with your healthcare provider. Remember, there are effective ways to manage this symptom.",
+        "Sleep disturbances during menopause are unfortunately very common, and I know how frustrating this can be. Your body is going through significant hormonal changes that affect sleep. Try maintaining a regular sleep schedule, keeping your bedroom cool and dark, avoiding caffeine in the afternoon, and practicing relaxation techniques like deep breathing before bed. If sleep issues persist, consider discussing this with your healthcare provider as there are treatments that can help.",
+        "I want you to know that mood changes during menopause are completely normal and you're not alone in experiencing this. The hormonal fluctuations can significantly impact your emotional well-being. It's important to be gentle with yourself during this time. Regular exercise, stress management techniques, maintaining social connections, and ensuring adequate sleep can all help support your emotional health. If you're experiencing persistent mood changes that are affecting your daily life, I strongly encourage you to speak with a healthcare provider or mental health professional who can provide additional support and treatment options.",
+        "Weight changes during menopause are common due to hormonal shifts. Focus on a balanced diet, regular exercise, and maintaining muscle mass through strength training. Remember, your worth isn't defined by your weight.",
+        "Regular exercise is excellent for menopause management! Aim for a mix of cardio, strength training, and flexibility exercises. Even 30 minutes of moderate activity most days can make a significant difference.",
+        "A balanced diet rich in fruits, vegetables, whole grains, lean proteins, and healthy fats can help manage menopause symptoms. Focus on calcium-rich foods for bone health and stay hydrated.",
+    )
+
+    # Fallback education topics: stages, symptoms, lifestyle
+    _TOPIC_KEYWORDS = _compile_keyword_groups(
+        (
+            ("stage", "phases", "pre", "peri", "post"),
+            ("symptom", "hot flash", "mood", "sleep"),
+            ("lifestyle", "exercise", "diet", "stress"),
+        )
+    )
+
     def __init__(self):
         """Initialize the Nebius AI service."""
         self.api_key = os.getenv("NEBIUS_AI_API_KEY") or os.getenv("NEBIUS_API_KEY")
         self.base_url = "https://api.studio.nebius.com/v1"  # Correct Nebius AI endpoint
-        self.session_context = {}
+        self._completions_url = f"{self.base_url}/chat/completions"
+        self.session_context = OrderedDict()
+        self._session_touched = {}
+        self._session_lock = threading.Lock()
+
+        # LRU cache of successful responses, keyed by endpoint and request body digest
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+
+        # Request counters for tuning cache sizes, retries and concurrency limits
+        self._stats = dict.fromkeys(
+            ("calls", "cache_hits", "errors", "ns", "bytes_out", "bytes_in"), 0
+        )
+        self._stats_lock = threading.Lock()
+
+        # Pooled HTTP session so repeated calls reuse the TLS connection
+        self._session = requests.Session()
+        self._session.headers.update({"Content-Type": "application/json"})
+        if self.api_key:
+            self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+        # Retry failed connects and transient statuses, but never a read timeout:
+        # the completion may still be running and another 90s wait helps no one
+        retries = Retry(
+            total=3,
+            connect=2,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset({"POST"}),
+            # A 429/503 Retry-After can ask for minutes; keep to the short
+            # backoff so a rate-limited turn falls back instead of hanging
+            respect_retry_after_header=False,
+        )
+        self._session.mount(
+            "https://", HTTPAdapter(pool_connections=4, pool_maxsize=20, max_retries=retries)
+        )
 
         # Fallback content for when Nebius AI is unavailable
-        self.fallback_responses = self._load_fallback_content()
+        self.fallback_responses = _FALLBACK_CONTENT
 
         if self.api_key:
             logger.info("NEBIUS_AI_API_KEY found. Nebius AI integration enabled.")
         else:
             logger.warning("NEBIUS_AI_API_KEY not found. Using fallback responses.")
 
-    def _load_fallback_content(self) -> Dict[str, Any]:
-        """Load fallback content for when Nebius AI is unavailable."""
+    @staticmethod
+    def _chat_body(system_prompt: str, user_message: str) -> Dict[str, Any]:
+        """Build a chat completion request body, truncating an oversized user message."""
+        if len(user_message) > _MAX_USER_MESSAGE_CHARS:
+            user_message = user_message[:_MAX_USER_MESSAGE_CHARS] + "…[truncated]"
+
+        # Create the proper request format for Nebius AI based on their documentation
         return {
-            "chat_responses": [
-                "I understand you're going through a challenging time. How can I help support you today?",
-                "It's completely normal to have questions about menopause. I'm here to listen and provide guidance.",
-                "Your health and wellbeing matter. What specific concerns would you like to discuss?",
-                "Every woman's experience is unique. Let's work together to find what helps you feel your best.",
-                "I'm here to provide compassionate support and evidence-based information. What's on your mind?",
+            **_BASE_CHAT_BODY,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": [{"type": "text", "text": user_message}]},
             ],
-            "recommendations": {
-                "pre_menopause": [
-                    "Focus on maintaining regular menstrual cycles through balanced nutrition and stress management.",
-                    "Consider tracking your cycles to understand your body's patterns better.",
-                    "Regular exercise can help support hormonal balance and overall health.",
-                ],
-                "peri_menopause": [
-                    "Monitor symptoms closely and consider keeping a symptom diary.",
-                    "Cooling strategies like fans, light clothing, and cool drinks can help with hot flashes.",
-                    "Stress management techniques such as meditation or yoga may help with mood changes.",
-                ],
-                "post_menopause": [
-                    "Prioritize bone health with calcium-rich foods and weight-bearing exercise.",
-                    "Focus on cardiovascular health through regular physical activity and heart-healthy diet.",
-                    "Continue monitoring your overall health and discuss any concerns with your healthcare provider.",
-                ],
-            },
-            "educational_content": {
-                "menopause_stages": {
-                    "title": "Understanding Menopause Stages",
-                    "content": "Menopause is a natural biological process that occurs in three stages: Pre-menopause (regular cycles), Peri-menopause (transition with irregular cycles), and Post-menopause (12+ months without periods).",
-                },
-                "symptoms": {
-                    "title": "Common Menopause Symptoms",
-                    "content": "Common symptoms include hot flashes, night sweats, mood changes, sleep disturbances, vaginal dryness, and changes in menstrual cycles. Each woman's experience is unique.",
-                },
-                "lifestyle": {
-                    "title": "Lifestyle Management",
-                    "content": "Regular exercise, balanced nutrition, stress management, adequate sleep, and avoiding smoking can help manage menopause symptoms and support overall health.",
-                },
-            },
         }
 
     def _make_api_request(self, endpoint: str, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -91,44 +326,45 @@ class NebiusAIService:
             return None
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            }
-
             # Format the request for Nebius AI chat completion
             if endpoint == "chat":
-                # Create the proper request format for Nebius AI based on their documentation
-                request_data = {
-                    "model": "deepseek-ai/DeepSeek-R1-0528",  # Using the model from Nebius AI docs
-                    "messages": [
-                        {
-                            "role": "system",
-                            "content": data.get("system_prompt", "You are a helpful assistant."),
-                        },
-                        {
-                            "role": "user",
-                            "content": [{"type": "text", "text": data.get("user_message", "")}],
-                        },
-                    ],
-                    "max_tokens": 500,
-                    "temperature": 0.7,
-                }
+                request_data = self._chat_body(
+                    data.get("system_prompt", "You are a helpful assistant."),
+                    data.get("user_message", ""),
+                )
             else:
                 request_data = data
 
-            response = requests.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=request_data,
-                timeout=90,
+            body = _json_dumps(request_data)
+            cache_key = (endpoint, hashlib.blake2b(body, digest_size=16).digest())
+            with self._response_cache_lock:
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    self._response_cache.move_to_end(cache_key)
+                    self._record_stats(cache_hits=1)
+                    return cached
+
+            # Fail fast on connect; completions themselves can take a while
+            start = time.perf_counter_ns()
+            response = self._session.post(
+                self._completions_url,
+                data=body,
+                timeout=(3.05, 90),
+            )
+            self._record_stats(
+                calls=1,
+                errors=int(response.status_code != 200),
+                ns=time.perf_counter_ns() - start,
+                bytes_out=len(body),
+                bytes_in=len(response.content),
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = _json_loads(response.content)
                 # Extract the message from Nebius AI response
                 if endpoint == "chat" and "choices" in result:
-                    return {"message": result["choices"][0]["message"]["content"]}
+                    result = {"message": result["choices"][0]["message"]["content"]}
+                self._cache_response(cache_key, result)
                 return result
             else:
                 logger.error(f"Nebius AI API error: {response.status_code} - {response.text}")
@@ -136,8 +372,34 @@ class NebiusAIService:
 
         except Exception as e:
             logger.error(f"Error making Nebius AI request: {e}")
+            self._record_stats(errors=1)
             return None
 
+    def _cache_response(self, cache_key: Tuple[str, bytes], result: Dict[str, Any]):
+        """Store a successful response, evicting the least recently used beyond the cap."""
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = result
+            self._response_cache.move_to_end(cache_key)
+            while len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _record_stats(self, **counts: int):
+        """Add to the request counters."""
+        with self._stats_lock:
+            for name, value in counts.items():
+                self._stats[name] += value
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get request counters for this service.
+
+        Returns:
+            Counts of API calls, cache hits and errors, total request time in
+            nanoseconds, and request/response bytes
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
     def chat(self, user_message: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Generate a chatbot response using Nebius AI.
@@ -149,28 +411,15 @@ class NebiusAIService:
         Returns:
             AI-generated response
         """
-        try:
-            # Create counseling prompt for Nebius AI
-            counseling_prompt = """You are a compassionate and knowledgeable menopause counselor and women's health specialist. 
-            
-            The user may be experiencing menopause-related issues and needs empathetic support and guidance. 
-            
-            Please respond as a caring counselor who:
-            - Shows empathy and understanding
-            - Provides evidence-based information about menopause
-            - Offers practical coping strategies
-            - Encourages professional medical consultation when appropriate
-            - Uses a warm, supportive tone
-            - Validates their experiences and concerns
-            
-            Remember to be sensitive to the personal nature of their questions and maintain a professional yet caring demeanor."""
+        if not self.api_key:
+            return self._get_fallback_chat_response(user_message, context)
 
+        try:
             # Prepare context for Nebius AI with counseling prompt
             context_data = {
-                "system_prompt": counseling_prompt,
+                "system_prompt": _CHAT_SYSTEM_PROMPT,
                 "user_message": user_message,
                 "context": context or {},
-                "timestamp": datetime.now().isoformat(),
                 "session_id": context.get("session_id") if context else None,
             }
 
@@ -187,33 +436,62 @@ class NebiusAIService:
             logger.error(f"Chat error: {e}")
             return self._get_fallback_chat_response(user_message, context)
 
+    def chat_stream(
+        self, user_message: str, context: Optional[Dict[str, Any]] = None
+    ) -> Iterator[str]:
+        """
+        Stream a chatbot response from Nebius AI as it is generated.
+
+        Args:
+            user_message: User's message
+            context: Additional context about user's health data
+
+        Yields:
+            Pieces of the response text; the local fallback response arrives in
+            one piece if Nebius AI is unavailable
+        """
+        streamed = False
+        if self.api_key:
+            request_data = {**self._chat_body(_CHAT_SYSTEM_PROMPT, user_message), "stream": True}
+            try:
+                with self._session.post(
+                    self._completions_url,
+                    data=_json_dumps(request_data),
+                    timeout=(3.05, 90),
+                    stream=True,
+                ) as response:
+                    if response.status_code != 200:
+                        logger.error(
+                            f"Nebius AI API error: {response.status_code} - {response.text}"
+                        )
+                    else:
+                        # Server-sent events: one "data: {...}" line per chunk
+                        for line in response.iter_lines():
+                            if not line.startswith(b"data: "):
+                                continue
+                            chunk = line[len(b"data: ") :]
+                            if chunk == b"[DONE]":
+                                break
+                            choices = _json_loads(chunk).get("choices")
+                            delta = choices[0].get("delta", {}).get("content") if choices else None
+                            if delta:
+                                streamed = True
+                                yield delta
+            except Exception as e:
+                logger.error(f"Chat stream error: {e}")
+
+        if not streamed:
+            yield self._get_fallback_chat_response(user_message, context)
+
     def _get_fallback_chat_response(
         self, user_message: str, context: Optional[Dict[str, Any]]
     ) -> str:
         """Get fallback chat response when Nebius AI is unavailable."""
         # Simple keyword-based responses with counseling tone
-        message_lower = user_message.lower()
-
-        if any(word in message_lower for word in ["hot flash", "hot flush", "sweating"]):
-            return "I understand that hot flashes can be really challenging and disruptive to your daily life. You're not alone in this experience. Try wearing layers that you can easily remove, using a fan, drinking cool water, and avoiding triggers like spicy foods and stress. If they're severely impacting your quality of life, I'd encourage you to discuss treatment options with your healthcare provider. Remember, there are effective ways to manage this symptom."
-
-        elif any(word in message_lower for word in ["sleep", "insomnia", "tired"]):
-            return "Sleep disturbances during menopause are unfortunately very common, and I know how frustrating this can be. Your body is going through significant hormonal changes that affect sleep. Try maintaining a regular sleep schedule, keeping your bedroom cool and dark, avoiding caffeine in the afternoon, and practicing relaxation techniques like deep breathing before bed. If sleep issues persist, consider discussing this with your healthcare provider as there are treatments that can help."
-
-        elif any(word in message_lower for word in ["mood", "depression", "anxiety", "emotional"]):
-            return "I want you to know that mood changes during menopause are completely normal and you're not alone in experiencing this. The hormonal fluctuations can significantly impact your emotional well-being. It's important to be gentle with yourself during this time. Regular exercise, stress management techniques, maintaining social connections, and ensuring adequate sleep can all help support your emotional health. If you're experiencing persistent mood changes that are affecting your daily life, I strongly encourage you to speak with a healthcare provider or mental health professional who can provide additional support and treatment options."
-
-        elif any(word in message_lower for word in ["weight", "gain", "lose"]):
-            return "Weight changes during menopause are common due to hormonal shifts. Focus on a balanced diet, regular exercise, and maintaining muscle mass through strength training. Remember, your worth isn't defined by your weight."
-
-        elif any(word in message_lower for word in ["exercise", "workout", "fitness"]):
-            return "Regular exercise is excellent for menopause management! Aim for a mix of cardio, strength training, and flexibility exercises. Even 30 minutes of moderate activity most days can make a significant difference."
-
-        elif any(word in message_lower for word in ["diet", "nutrition", "food", "eat"]):
-            return "A balanced diet rich in fruits, vegetables, whole grains, lean proteins, and healthy fats can help manage menopause symptoms. Focus on calcium-rich foods for bone health and stay hydrated."
-
-        else:
-            return random.choice(self.fallback_responses["chat_responses"])
+        topic = _match_keyword_group(self._CHAT_KEYWORDS, user_message.lower())
+        if topic is not None:
+            return self._CHAT_KEYWORD_RESPONSES[topic]
+        return random.choice(self.fallback_responses["chat_responses"])
 
     def generate_recommendations(self, health_data: Dict[str, Any]) -> List[Dict[str, str]]:
         """
@@ -225,26 +503,20 @@ class NebiusAIService:
         Returns:
             List of personalized recommendations
         """
-        try:
-            # Create counseling prompt for recommendations
-            counseling_prompt = """You are a compassionate menopause counselor and women's health specialist. 
-            
-            Based on the user's health data and predictions, provide personalized, empathetic recommendations that:
-            - Show understanding and validation of their experience
-            - Offer practical, evidence-based coping strategies
-            - Consider their specific menopause stage and symptoms
-            - Encourage professional medical consultation when appropriate
-            - Use a warm, supportive tone
-            - Prioritize their wellbeing and quality of life
-            
-            Format your response as a list of recommendations with categories, titles, descriptions, and priority levels."""
+        if not self.api_key:
+            return self._get_fallback_recommendations(health_data)
 
+        try:
             # Prepare data for Nebius AI with counseling prompt
             recommendation_data = {
-                "system_prompt": counseling_prompt,
-                "user_message": f"Please provide personalized recommendations based on this health data: {health_data}",
+                "system_prompt": _REC_SYSTEM_PROMPT,
+                # Sorted JSON reads better to the model than a Python repr and keeps
+                # the payload, and so its response cache key, stable across calls
+                "user_message": (
+                    "Please provide personalized recommendations based on this health data: "
+                    + _dumps_health_data(health_data)
+                ),
                 "health_data": health_data,
-                "timestamp": datetime.now().isoformat(),
                 "request_type": "recommendations",
             }
 
@@ -347,27 +619,15 @@ class NebiusAIService:
         Returns:
             Educational content dictionary
         """
-        try:
-            # Create counseling prompt for educational content
-            counseling_prompt = """You are a compassionate menopause counselor and women's health educator. 
-            
-            Provide educational content about the requested topic that:
-            - Uses clear, accessible language that's easy to understand
-            - Shows empathy and understanding for women's experiences
-            - Provides evidence-based information
-            - Offers practical tips and strategies
-            - Encourages professional medical consultation when appropriate
-            - Uses a warm, supportive tone
-            - Validates that menopause experiences are normal and manageable
-            
-            Structure your response with a clear title and comprehensive, empathetic content."""
+        if not self.api_key:
+            return self._get_fallback_educational_content(topic)
 
+        try:
             # Prepare data for Nebius AI with counseling prompt
             content_data = {
-                "system_prompt": counseling_prompt,
+                "system_prompt": _EDU_SYSTEM_PROMPT,
                 "user_message": f"Please provide educational content about: {topic}",
                 "topic": topic,
-                "timestamp": datetime.now().isoformat(),
                 "request_type": "educational_content",
             }
 
@@ -392,53 +652,185 @@ class NebiusAIService:
 
     def _get_fallback_educational_content(self, topic: str) -> Dict[str, str]:
         """Get fallback educational content when Nebius AI is unavailable."""
-        topic_lower = topic.lower()
+        match = _match_topic_keyword_group(self._TOPIC_KEYWORDS, topic.lower())
 
         # Check for specific topics with counseling tone
-        if any(word in topic_lower for word in ["stage", "phases", "pre", "peri", "post"]):
+        if match == 0:
             content = self.fallback_responses["educational_content"]["menopause_stages"]
-            content["content"] = (
-                f"I understand you're seeking information about menopause stages. {content['content']} Remember, every woman's journey is unique, and it's completely normal to have questions about what to expect during this transition."
-            )
-            return content
-        elif any(word in topic_lower for word in ["symptom", "hot flash", "mood", "sleep"]):
+            return {
+                "title": content["title"],
+                "content": f"I understand you're seeking information about menopause stages. {content['content']} Remember, every woman's journey is unique, and it's completely normal to have questions about what to expect during this transition.",
+            }
+        elif match == 1:
             content = self.fallback_responses["educational_content"]["symptoms"]
-            content["content"] = (
-                f"I know that menopause symptoms can be challenging and disruptive. {content['content']} Please remember that you're not alone in experiencing these symptoms, and there are many effective ways to manage them with support from healthcare providers."
-            )
-            return content
-        elif any(word in topic_lower for word in ["lifestyle", "exercise", "diet", "stress"]):
+            return {
+                "title": content["title"],
+                "content": f"I know that menopause symptoms can be challenging and disruptive. {content['content']} Please remember that you're not alone in experiencing these symptoms, and there are many effective ways to manage them with support from healthcare providers.",
+            }
+        elif match == 2:
             content = self.fallback_responses["educational_content"]["lifestyle"]
-            content["content"] = (
-                f"Taking care of your overall wellbeing during menopause is so important. {content['content']} Making small, sustainable changes can have a big impact on how you feel during this transition."
-            )
-            return content
+            return {
+                "title": content["title"],
+                "content": f"Taking care of your overall wellbeing during menopause is so important. {content['content']} Making small, sustainable changes can have a big impact on how you feel during this transition.",
+            }
         else:
             return {
                 "title": "Menopause Information",
                 "content": "I want you to know that menopause is a natural transition that every woman experiences, and it's completely normal to have questions or concerns. Understanding your body's changes and working with healthcare providers to manage symptoms and maintain health is an important part of this journey. Remember, you're not alone, and there are many resources and support systems available to help you through this transition.",
             }
 
+    def generate_recommendations_batch(
+        self, health_data_list: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Generate recommendations for several health profiles concurrently.
+
+        Args:
+            health_data_list: Health data and predictions, one entry per profile
+
+        Returns:
+            Recommendation lists in the same order as health_data_list
+        """
+        return self._map_concurrently(self.generate_recommendations, health_data_list)
+
+    def generate_educational_content_batch(self, topics: List[str]) -> List[Dict[str, str]]:
+        """
+        Generate educational content for several topics concurrently.
+
+        Args:
+            topics: Educational topics to generate content for
+
+        Returns:
+            Educational content dictionaries in the same order as topics
+        """
+        return self._map_concurrently(self.generate_educational_content, topics)
+
+    def _map_concurrently(self, func, items: List[Any]) -> List[Any]:
+        """Apply func to each item, overlapping the Nebius AI round-trips in a thread pool."""
+        if not self.api_key or len(items) < 2:
+            # Fallback content is local, so there is no network wait to overlap
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(_MAX_CONCURRENT_REQUESTS, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    async def achat(self, user_message: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Async variant of chat() that keeps the event loop free during the API call."""
+        return await asyncio.to_thread(self.chat, user_message, context)
+
+    async def agenerate_recommendations(self, health_data: Dict[str, Any]) -> List[Dict[str, str]]:
+        """Async variant of generate_recommendations()."""
+        return await asyncio.to_thread(self.generate_recommendations, health_data)
+
+    async def agenerate_educational_content(self, topic: str) -> Dict[str, str]:
+        """Async variant of generate_educational_content()."""
+        return await asyncio.to_thread(self.generate_educational_content, topic)
+
+    async def chat_batch(
+        self, messages: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[str]:
+        """
+        Answer several chat messages concurrently.
+
+        Args:
+            messages: (user message, context) pairs
+
+        Returns:
+            Responses in the same order as messages
+        """
+        # Created per call: on Python 3.9 a semaphore binds to the loop it was built in
+        limiter = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+
+        async def answer(user_message, context):
+            async with limiter:
+                return await self.achat(user_message, context)
+
+        responses = await asyncio.gather(*(answer(message, context) for message, context in messages))
+        return list(responses)
+
+    async def generate_page_bundle(
+        self, health_data: Dict[str, Any], topic: str, user_message: str
+    ) -> Tuple[str, List[Dict[str, str]], Dict[str, str]]:
+        """
+        Fetch a chat reply, recommendations and educational content concurrently.
+
+        Each call already falls back to local content on failure, so one failed
+        request never affects the other two.
+
+        Args:
+            health_data: User's health data and predictions
+            topic: Educational topic to generate content for
+            user_message: User's chat message
+
+        Returns:
+            (chat response, recommendations, educational content)
+        """
+        chat_response, recommendations, content = await asyncio.gather(
+            self.achat(user_message),
+            self.agenerate_recommendations(health_data),
+            self.agenerate_educational_content(topic),
+        )
+        return chat_response, recommendations, content
+
     def update_session_context(self, session_id: str, context: Dict[str, Any]):
         """Update session context for conversation continuity."""
-        self.session_context[session_id] = {
-            **self.session_context.get(session_id, {}),
-            **context,
-            "last_updated": datetime.now().isoformat(),
-        }
+        with self._session_lock:
+            self._drop_if_idle(session_id)
+            session = self.session_context.setdefault(session_id, {})
+            session.update(context)
+            session["last_updated"] = datetime.now().isoformat()
+            self._touch_session(session_id)
 
     def get_session_context(self, session_id: str) -> Dict[str, Any]:
         """Get session context for conversation continuity."""
-        return self.session_context.get(session_id, {})
+        with self._session_lock:
+            if self._drop_if_idle(session_id) or session_id not in self.session_context:
+                return {}
+            self._touch_session(session_id)
+            return self.session_context[session_id]
+
+    def _drop_if_idle(self, session_id: str) -> bool:
+        """Remove a session that has been idle too long; return whether it was removed."""
+        touched = self._session_touched.get(session_id)
+        if touched is None or time.monotonic() - touched <= _SESSION_IDLE_SECONDS:
+            return False
+        del self.session_context[session_id]
+        del self._session_touched[session_id]
+        return True
+
+    def _touch_session(self, session_id: str):
+        """Mark a session as most recently used and evict idle or excess sessions."""
+        now = time.monotonic()
+        self.session_context.move_to_end(session_id)
+        self._session_touched[session_id] = now
+
+        # Oldest first, so stop at the first session that is neither excess nor idle
+        while self.session_context:
+            oldest = next(iter(self.session_context))
+            idle = now - self._session_touched[oldest] > _SESSION_IDLE_SECONDS
+            if not idle and len(self.session_context) <= _MAX_SESSIONS:
+                break
+            self.session_context.popitem(last=False)
+            del self._session_touched[oldest]
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self._session.close()
 
 
 # Global instance for easy access
 nebius_service = None
+_nebius_service_lock = threading.Lock()
 
 
 def get_nebius_service():
     """Get or create the global Nebius AI service instance."""
     global nebius_service
     if nebius_service is None:
-        nebius_service = NebiusAIService()
+        # Re-check under the lock so concurrent first calls build only one service
+        with _nebius_service_lock:
+            if nebius_service is None:
+                service = NebiusAIService()
+                atexit.register(service.close)
+                nebius_service = service
     return nebius_service
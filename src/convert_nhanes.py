@@ -1,8 +1,19 @@
 import pandas as pd
 import os
 import glob
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+def _read_xpt(file_path):
+    """
+    Read one .xpt file and tag its rows with the source file and category.
+    Module-level so worker processes can pickle it.
+    """
+    df = pd.read_sas(file_path)
+    df['source_file'] = os.path.basename(file_path)
+    df['source_category'] = os.path.basename(os.path.dirname(file_path))
+    return df
+
 def convert_xpt_to_csv():
     """
     Convert all .xpt files from NHANES raw data to a unified CSV file.
@@ -23,31 +34,31 @@ def convert_xpt_to_csv():
     all_dataframes = []
     file_info = []
     
-    for file_path in xpt_files:
-        try:
-            print(f"Processing: {file_path}")
-            
-            # Read the .xpt file
-            df = pd.read_sas(file_path)
-            
-            # Add source file information
-            df['source_file'] = os.path.basename(file_path)
-            df['source_category'] = os.path.basename(os.path.dirname(file_path))
-            
-            # Store file info
-            file_info.append({
-                'file_name': os.path.basename(file_path),
-                'category': os.path.basename(os.path.dirname(file_path)),
-                'rows': len(df),
-                'columns': len(df.columns)
-            })
-            
-            all_dataframes.append(df)
-            print(f"  - Loaded {len(df)} rows, {len(df.columns)} columns")
-            
-        except Exception as e:
-            print(f"  - Error processing {file_path}: {str(e)}")
-            continue
+    # Parse the files in parallel; results are collected in the original file order
+    with ProcessPoolExecutor() as executor:
+        futures = [executor.submit(_read_xpt, file_path) for file_path in xpt_files]
+        
+        for file_path, future in zip(xpt_files, futures):
+            try:
+                print(f"Processing: {file_path}")
+                
+                # Wait for the parsed .xpt file
+                df = future.result()
+                
+                # Store file info
+                file_info.append({
+                    'file_name': os.path.basename(file_path),
+                    'category': os.path.basename(os.path.dirname(file_path)),
+                    'rows': len(df),
+                    'columns': len(df.columns)
+                })
+                
+                all_dataframes.append(df)
+                print(f"  - Loaded {len(df)} rows, {len(df.columns)} columns")
+                
+            except Exception as e:
+                print(f"  - Error processing {file_path}: {str(e)}")
+                continue
     
     if not all_dataframes:
         print("No dataframes were successfully loaded!")
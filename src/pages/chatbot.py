@@ -14,7 +14,7 @@ from datetime import datetime
 import streamlit as st
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from chatbot_nebius import get_nebius_service
+from streamlit_services import get_nebius_service
 
 
 def strip_html_tags(text):
@@ -19,7 +19,7 @@ warnings.filterwarnings("ignore", category=DeprecationWarning, module="plotly")
 # Add src directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from prediction_service import get_prediction_service
+from streamlit_services import get_prediction_service
 
 
 def render_predictions_page():
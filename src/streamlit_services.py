@@ -0,0 +1,26 @@
+"""
+Cached Service Accessors for MenoBalance AI
+Builds the Nebius AI and prediction services once per Streamlit server process,
+so clearing the resource cache from the app menu rebuilds them.
+"""
+
+import atexit
+
+import streamlit as st
+
+from chatbot_nebius import NebiusAIService
+from prediction_service import PredictionService
+
+
+@st.cache_resource(show_spinner=False)
+def get_nebius_service():
+    """Create the Nebius AI service, once per Streamlit server process."""
+    service = NebiusAIService()
+    atexit.register(service.close)
+    return service
+
+
+@st.cache_resource(show_spinner="Loading prediction models...")
+def get_prediction_service():
+    """Create the prediction service, loading the models once per Streamlit server process."""
+    return PredictionService()
@@ -13,6 +13,7 @@ import requests
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
+import chatbot_nebius
 from chatbot_nebius import NebiusAIService
 from prediction_service import PredictionService
 
@@ -125,6 +126,37 @@ class TestMenoBalanceAI(unittest.TestCase):
         except Exception as e:
             print(f"Nebius AI service test failed (expected if no API key): {e}")
 
+    def test_session_context_expiry(self):
+        """Test that idle sessions expire and the session count stays capped."""
+        print("Testing session context expiry...")
+
+        nebius_service = NebiusAIService()
+
+        # An idle session is dropped on read rather than revived
+        nebius_service.update_session_context("a", {"x": 1})
+        nebius_service._session_touched["a"] -= chatbot_nebius._SESSION_IDLE_SECONDS + 1
+        self.assertEqual(nebius_service.get_session_context("a"), {})
+        self.assertNotIn("a", nebius_service.session_context)
+
+        # An idle session is started fresh on update rather than merged into
+        nebius_service.update_session_context("b", {"x": 1})
+        nebius_service._session_touched["b"] -= chatbot_nebius._SESSION_IDLE_SECONDS + 1
+        nebius_service.update_session_context("b", {"y": 2})
+        self.assertNotIn("x", nebius_service.get_session_context("b"))
+
+        # The least recently used session is evicted past the cap
+        original_max = chatbot_nebius._MAX_SESSIONS
+        chatbot_nebius._MAX_SESSIONS = 2
+        try:
+            nebius_service.update_session_context("c", {})
+            nebius_service.get_session_context("b")
+            nebius_service.update_session_context("d", {})
+            self.assertEqual(list(nebius_service.session_context), ["b", "d"])
+        finally:
+            chatbot_nebius._MAX_SESSIONS = original_max
+
+        print("Session context expiry test passed")
+
     def test_api_health_endpoint(self):
         """Test API health endpoint."""
         print("Testing API health endpoint...")